@@ -29,9 +29,13 @@ def parse_iso8601(s):
     Returns:
         UTC datetime object or None if parsing fails
     """
+    # datetime.fromisoformat is the C parser; it only needs the trailing 'Z'
+    # spelled as an offset on Python < 3.11
     try:
-        return datetime.fromisoformat(s.replace('Z','+00:00')).astimezone(timezone.utc)
-    except Exception:
+        if s.endswith('Z'):
+            s = s[:-1] + '+00:00'
+        return datetime.fromisoformat(s).astimezone(timezone.utc)
+    except (AttributeError, TypeError, ValueError, OverflowError):
         return None
 
 class AviationWeatherAPIError(Exception):
@@ -44,7 +48,10 @@ class NetworkError(AviationWeatherAPIError):
 
 class APIError(AviationWeatherAPIError):
     """API-related errors (4xx, 5xx status codes)"""
-    pass
+    
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code  # HTTP status, None for non-HTTP failures
 
 class CircuitBreakerState(Enum):
     """Circuit breaker states"""
@@ -127,6 +134,8 @@ class FAAAPIClient:
             failure_threshold=circuit_breaker_failures,
             recovery_timeout=circuit_breaker_timeout
         )
+        # Retry backoff hook; tests swap in a no-op instead of patching time.sleep
+        self._sleep = time.sleep
         
     def _make_request(self, endpoint: str, params: dict[str, str]) -> tuple[int, str]:
         """
@@ -180,24 +189,24 @@ class FAAAPIClient:
                     return status_code, ""
                 elif 400 <= status_code < 500:
                     # Client error - don't retry
-                    raise APIError(f"Client error {status_code}: {response_body}")
+                    raise APIError(f"Client error {status_code}: {response_body}", status_code)
                 elif 500 <= status_code < 600:
                     # Server error - retry
                     if attempt < self.max_retries:
                         delay = self.retry_delay * (2 ** attempt)
                         logger.warning(f"Server error {status_code}, retrying in {delay}s (attempt {attempt + 1}/{self.max_retries + 1})")
-                        time.sleep(delay)
+                        self._sleep(delay)
                         continue
                     else:
-                        raise APIError(f"Server error {status_code} after {self.max_retries} retries: {response_body}")
+                        raise APIError(f"Server error {status_code} after {self.max_retries} retries: {response_body}", status_code)
                 else:
-                    raise APIError(f"Unexpected HTTP status {status_code}: {response_body}")
+                    raise APIError(f"Unexpected HTTP status {status_code}: {response_body}", status_code)
                     
             except (urllib.error.URLError, OSError) as e:
                 if attempt < self.max_retries:
                     delay = self.retry_delay * (2 ** attempt)
                     logger.warning(f"Network error: {e}, retrying in {delay}s (attempt {attempt + 1}/{self.max_retries + 1})")
-                    time.sleep(delay)
+                    self._sleep(delay)
                     continue
                 else:
                     raise NetworkError(f"Network error after {self.max_retries} retries: {e}")
@@ -118,6 +118,28 @@ class LedStrip:
                 self.logger.error(f"Error setting pixel {led}: {e}")
                 return False
 
+    def set_pixel_colors(self, indices: List[int], colors: list) -> bool:
+        """Set several individual pixels under a single lock acquisition"""
+        if self.emergency_shutdown or not self.initialized:
+            return False
+            
+        if len(indices) != len(colors):
+            self.logger.error(f"Index/color count mismatch: {len(indices)} != {len(colors)}")
+            return False
+            
+        for led, color in zip(indices, colors):
+            if not self._validate_pixel_index(led) or not self._validate_color(color):
+                return False
+                
+        with self.lock:
+            try:
+                for led, color in zip(indices, colors):
+                    self.strip.setPixelColor(led, color)
+                return True
+            except Exception as e:
+                self.logger.error(f"Error setting pixels: {e}")
+                return False
+
     def show_pixels(self) -> bool:
         """Display pixels with rate limiting and thread safety"""
         if self.emergency_shutdown or not self.initialized:
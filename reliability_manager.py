@@ -11,6 +11,7 @@ import logging
 import signal
 import sys
 import os
+import shutil
 from contextlib import contextmanager
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
@@ -25,6 +26,19 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
+try:
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = 4096
+
+# Optional systemd import (watchdog notifications)
+try:
+    from systemd.daemon import notify as systemd_notify
+    SYSTEMD_AVAILABLE = True
+except ImportError:
+    SYSTEMD_AVAILABLE = False
+    systemd_notify = None
+
 
 class HealthStatus(Enum):
     """Health status enumeration"""
@@ -95,23 +109,23 @@ class FrameRateLimiter:
         
     def wait_for_next_frame(self) -> bool:
         """Wait for next frame time, returns True if frame should be rendered"""
+        frame_time = self.frame_time
+        max_ft = self.max_frame_time
         current_time = time.time()
         elapsed = current_time - self.last_frame_time
         
-        # Detect potential hangs
-        if elapsed > self.max_frame_time:
-            logging.warning(f"Frame time exceeded {self.max_frame_time}s: {elapsed:.3f}s")
-            self.frame_skip_count += 1
+        # Detect potential hangs - consecutive overruns accumulate, any
+        # on-time frame resets the count
+        overrun = elapsed > max_ft
+        self.frame_skip_count = (self.frame_skip_count + 1) * overrun
+        if overrun:
+            logging.warning(f"Frame time exceeded {max_ft}s: {elapsed:.3f}s")
             if self.frame_skip_count > 10:
                 raise Exception("Excessive frame skipping detected - potential hang")
         
         # Frame rate limiting
-        if elapsed < self.frame_time:
-            sleep_time = self.frame_time - elapsed
-            time.sleep(sleep_time)
-            self.frame_skip_count = 0
-        else:
-            self.frame_skip_count = 0
+        if elapsed < frame_time:
+            time.sleep(frame_time - elapsed)
             
         self.last_frame_time = time.time()
         return True
@@ -181,34 +195,35 @@ class ResourceManager:
 class HealthMonitor:
     """Health monitoring and self-test system"""
     
+    # Health thresholds (shared, never mutated per instance)
+    memory_warning_mb = 200
+    memory_critical_mb = 400
+    cpu_warning_percent = 70
+    cpu_critical_percent = 90
+    heartbeat_timeout = 60
+    metar_timeout = 300  # 5 minutes
+    led_test_interval = 60  # Test LED every 60 seconds
+    max_history = 100
+    log_file = "/var/log/livesectional/livesectional.log"
+    cpu_sample_min_interval = 1.0  # Seconds of wall time per CPU sample
+    
     def __init__(self, check_interval: int = 30):
         self.check_interval = check_interval
         self.last_heartbeat = time.time()
         self.last_metar_update = 0
         self.led_last_test = 0
-        self.led_test_interval = 60  # Test LED every 60 seconds
         self.metrics_history = []
-        self.max_history = 100
         self.logger = logging.getLogger('health')
-        
-        # Health thresholds
-        self.memory_warning_mb = 200
-        self.memory_critical_mb = 400
-        self.cpu_warning_percent = 70
-        self.cpu_critical_percent = 90
-        self.heartbeat_timeout = 60
-        self.metar_timeout = 300  # 5 minutes
+        self._last_cpu_sample = (time.monotonic(), time.process_time())
+        self._last_cpu_percent = 0.0
         
     def heartbeat(self):
         """Update main loop heartbeat"""
         self.last_heartbeat = time.time()
         
         # Send systemd watchdog notification
-        try:
-            from systemd.daemon import notify
-            notify('WATCHDOG=1')
-        except ImportError:
-            pass  # systemd not available
+        if SYSTEMD_AVAILABLE:
+            systemd_notify('WATCHDOG=1')
         
     def update_metar(self):
         """Update last METAR update timestamp"""
@@ -234,16 +249,41 @@ class HealthMonitor:
         """Collect current health metrics"""
         current_time = time.time()
         
-        # Memory usage
-        if PSUTIL_AVAILABLE:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            cpu_percent = process.cpu_percent()
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            # Linux fast path - memory, disk and log size from /proc and stat calls
+            memory_mb, disk_space_mb, log_size_mb = snapshot
+            cpu_percent = self._get_process_cpu_percent()
         else:
-            # Fallback to /proc/meminfo and /proc/stat
-            memory_mb = self._get_memory_usage_fallback()
-            cpu_percent = self._get_cpu_usage_fallback()
+            # Memory usage
+            if PSUTIL_AVAILABLE:
+                process = psutil.Process()
+                memory_info = process.memory_info()
+                memory_mb = memory_info.rss / 1024 / 1024
+                cpu_percent = process.cpu_percent()
+            else:
+                # Fallback to /proc/meminfo and /proc/stat
+                memory_mb = self._get_memory_usage_fallback()
+                cpu_percent = self._get_cpu_usage_fallback()
+                
+            # Log file size
+            log_size_mb = 0
+            try:
+                if os.path.exists(self.log_file):
+                    log_size_mb = os.path.getsize(self.log_file) / 1024 / 1024
+            except OSError:
+                pass
+                
+            # Disk space
+            disk_space_mb = 0
+            try:
+                if PSUTIL_AVAILABLE:
+                    disk_usage = psutil.disk_usage('/')
+                    disk_space_mb = disk_usage.free / 1024 / 1024
+                else:
+                    disk_space_mb = self._get_disk_usage_fallback()
+            except OSError:
+                pass
         
         # LED responsiveness
         led_responsive = True
@@ -251,26 +291,6 @@ class HealthMonitor:
             led_responsive = self.test_led_responsiveness(led_controller)
             self.led_last_test = current_time
             
-        # Log file size
-        log_size_mb = 0
-        try:
-            log_file = "/var/log/livesectional/livesectional.log"
-            if os.path.exists(log_file):
-                log_size_mb = os.path.getsize(log_file) / 1024 / 1024
-        except:
-            pass
-            
-        # Disk space
-        disk_space_mb = 0
-        try:
-            if PSUTIL_AVAILABLE:
-                disk_usage = psutil.disk_usage('/')
-                disk_space_mb = disk_usage.free / 1024 / 1024
-            else:
-                disk_space_mb = self._get_disk_usage_fallback()
-        except:
-            pass
-            
         # Frame rate (simplified - would need actual frame tracking)
         frame_rate = 30.0  # Placeholder
         
@@ -318,6 +338,41 @@ class HealthMonitor:
             
         return HealthStatus.HEALTHY
         
+    def _snapshot(self) -> Optional[tuple]:
+        """Read process RSS, free disk space and log file size in one pass
+        
+        Returns (memory_mb, disk_space_mb, log_size_mb), or None when
+        /proc/self/statm is unavailable (non-Linux hosts).
+        """
+        try:
+            with open('/proc/self/statm', 'r') as f:
+                rss_pages = int(f.read().split()[1])
+            vfs = os.statvfs('/')
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+            
+        try:
+            log_size_mb = os.stat(self.log_file).st_size / 1024 / 1024
+        except OSError:
+            log_size_mb = 0  # Log file not created yet
+            
+        memory_mb = rss_pages * PAGE_SIZE / 1024 / 1024
+        disk_space_mb = vfs.f_bavail * vfs.f_frsize / 1024 / 1024
+        return memory_mb, disk_space_mb, log_size_mb
+        
+    def _get_process_cpu_percent(self) -> float:
+        """Process CPU usage since the previous sample, from process_time()"""
+        wall = time.monotonic()
+        last_wall, last_cpu = self._last_cpu_sample
+        elapsed = wall - last_wall
+        if elapsed < self.cpu_sample_min_interval:
+            # Window too short to be meaningful, report the previous reading
+            return self._last_cpu_percent
+        cpu = time.process_time()
+        self._last_cpu_sample = (wall, cpu)
+        self._last_cpu_percent = 100.0 * (cpu - last_cpu) / elapsed
+        return self._last_cpu_percent
+        
     def _get_memory_usage_fallback(self) -> float:
         """Fallback memory usage calculation using /proc/meminfo"""
         try:
@@ -331,7 +386,7 @@ class HealthMonitor:
                 for line in f:
                     if line.startswith('MemFree:'):
                         return float(line.split()[1]) / 1024
-        except:
+        except (OSError, ValueError, IndexError):
             pass
         return 0.0
         
@@ -346,17 +401,16 @@ class HealthMonitor:
                     idle = int(values[4]) + int(values[5])
                     total = sum(int(v) for v in values[1:8])
                     return 100.0 * (1.0 - idle / total) if total > 0 else 0.0
-        except:
+        except (OSError, ValueError, IndexError):
             pass
         return 0.0
         
     def _get_disk_usage_fallback(self) -> int:
         """Fallback disk usage calculation using shutil"""
         try:
-            import shutil
             usage = shutil.disk_usage('/')
             return usage.free / 1024 / 1024  # Convert to MB
-        except:
+        except OSError:
             pass
         return 0
         
@@ -374,24 +428,50 @@ class ReliabilityManager:
         self.frame_limiter = FrameRateLimiter()
         self.shared_clock = SharedClock()
         self.circuit_breakers = {}
+        self._cb_lock = threading.Lock()
         self.resource_manager = ResourceManager()
         self.logger = logging.getLogger('reliability')
         self.shutdown_requested = False
+        self._previous_handlers = {}
         
         # Setup signal handlers
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        self._install_signal_handlers()
+        
+    def _install_signal_handlers(self):
+        """Install shutdown handlers, chaining to any previously installed handler"""
+        # signal.signal() raises ValueError outside the main thread
+        if threading.current_thread() is not threading.main_thread():
+            self.logger.debug("Not on main thread, skipping signal handler setup")
+            return
+            
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(signum)
+            if getattr(previous, '__func__', None) is ReliabilityManager._signal_handler:
+                continue  # Another manager (normally the module singleton) owns it
+            self._previous_handlers[signum] = previous
+            signal.signal(signum, self._signal_handler)
         
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, initiating graceful shutdown")
         self.shutdown_requested = True
         
+        # Chain to the handler we replaced, but keep the defaults from
+        # terminating or interrupting before graceful shutdown can run
+        previous = self._previous_handlers.get(signum)
+        if callable(previous) and previous is not signal.default_int_handler:
+            previous(signum, frame)
+        
     def get_circuit_breaker(self, name: str) -> CircuitBreaker:
         """Get or create a circuit breaker for a specific operation"""
-        if name not in self.circuit_breakers:
-            self.circuit_breakers[name] = CircuitBreaker()
-        return self.circuit_breakers[name]
+        breaker = self.circuit_breakers.get(name)
+        if breaker is None:
+            # Lock only the miss path so concurrent callers share one breaker
+            with self._cb_lock:
+                breaker = self.circuit_breakers.get(name)
+                if breaker is None:
+                    breaker = self.circuit_breakers[name] = CircuitBreaker()
+        return breaker
         
     def safe_call(self, name: str, func: Callable, *args, **kwargs):
         """Execute function with circuit breaker protection"""
@@ -15,9 +15,11 @@ import signal
 import sys
 import os
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Optional psutil import
 try:
@@ -27,6 +29,14 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
+# Optional orjson import (faster report serialization)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Import reliability modules
 from reliability_manager import get_reliability_manager, HealthStatus
 from animation_controller import get_animation_controller, create_blink_effect, create_weather_effect
@@ -34,7 +44,11 @@ from logging_config import setup_logging, get_logger
 from leds import create_led_strip, managed_led_strip
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; fall back to a plain dataclass on 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TestResult:
     """Test result data structure"""
     test_name: str
@@ -50,11 +64,22 @@ class StressTestSuite:
     def __init__(self):
         self.logger = get_logger('stress_test')
         self.results = []
+        self._passed = 0
+        self._failed = 0
         self.running = False
+        self._stop_event = threading.Event()
         self.start_time = None
         self.led_strip = None
         self.animation_controller = None
         self.reliability_manager = get_reliability_manager()
+        self._proc = psutil.Process() if PSUTIL_AVAILABLE else None
+        # num_fds() is POSIX-only; resolve it once rather than per sample
+        self._num_fds = getattr(self._proc, 'num_fds', None)
+        self._metrics_cache = None
+        self._metrics_cache_ts = 0.0
+        self._metrics_min_interval = 0.5  # Seconds between real samples
+        self._slow_mem_interval = 60  # Seconds between memory_full_info() samples
+        self._worker_pool = None  # Created in setup(), shut down in cleanup()
         
         # Test configuration
         self.test_duration = 600  # 10 minutes default
@@ -62,6 +87,14 @@ class StressTestSuite:
         self.max_cpu_percent = 80
         self.target_fps = 30
         
+    def request_stop(self):
+        """Ask running tests and LED workers to stop at their next check"""
+        self._stop_event.set()
+    
+    def is_stop_requested(self) -> bool:
+        """Check if request_stop() has been called"""
+        return self._stop_event.is_set()
+    
     def setup(self):
         """Setup test environment"""
         setup_logging()
@@ -71,6 +104,16 @@ class StressTestSuite:
             # Initialize LED strip
             self.led_strip = create_led_strip(300)  # Assume 300 LEDs
             self.animation_controller = get_animation_controller(self.led_strip, self.target_fps)
+            
+            # Fresh pool per setup() so the suite can be re-run after cleanup()
+            self._worker_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix='led-stress')
+            
+            # Prime cpu_percent so the first sample measures a real window
+            # instead of returning 0.0
+            if PSUTIL_AVAILABLE:
+                self._proc.cpu_percent(interval=None)
+            else:
+                self.logger.warning("psutil not available, memory and CPU limits will not be checked")
             self.logger.info("Test environment setup complete")
         except Exception as e:
             self.logger.error(f"Failed to setup test environment: {e}")
@@ -86,10 +129,15 @@ class StressTestSuite:
         if self.led_strip:
             self.led_strip.emergency_shutdown()
             
+        if self._worker_pool:
+            self._worker_pool.shutdown(wait=False, cancel_futures=True)
+            self._worker_pool = None
+            
         self.logger.info("Test environment cleanup complete")
     
     def run_test(self, test_func, test_name: str, duration: int = 60) -> TestResult:
         """Run a single test and return results"""
+        test_name = sys.intern(test_name)
         self.logger.info(f"Starting test: {test_name}")
         start_time = time.time()
         error_message = None
@@ -102,8 +150,12 @@ class StressTestSuite:
             # Collect metrics
             metrics = self._collect_metrics()
             
-            # Check if test passed
-            passed = self._validate_test_results(metrics)
+            # A test cut short by request_stop() proves nothing about stability
+            if self._stop_event.is_set():
+                error_message = "interrupted"
+                passed = False
+            else:
+                passed = self._validate_test_results(metrics)
             
         except Exception as e:
             error_message = str(e)
@@ -121,74 +173,123 @@ class StressTestSuite:
         )
         
         self.results.append(result)
+        if result.passed:
+            self._passed += 1
+        else:
+            self._failed += 1
         self.logger.info(f"Test {test_name} completed: {'PASS' if passed else 'FAIL'}")
         
         return result
     
     def _collect_metrics(self) -> Dict[str, Any]:
-        """Collect system and application metrics"""
-        if PSUTIL_AVAILABLE:
-            process = psutil.Process()
-            return {
+        """Collect system and application metrics
+        
+        Memory is RSS from memory_info(), a single cheap /proc read. Avoid
+        memory_full_info() here: its USS/PSS figures walk /proc/<pid>/smaps
+        and are far too slow for per-sample use.
+        
+        cpu_percent is non-blocking and covers the time since the previous
+        sample (or since setup() for the first one). Calls closer together
+        than _metrics_min_interval return a copy of the previous sample.
+        Returns an empty dict when psutil is not available.
+        """
+        if not PSUTIL_AVAILABLE:
+            return {}
+        
+        now = time.monotonic()
+        if self._metrics_cache and now - self._metrics_cache_ts < self._metrics_min_interval:
+            return dict(self._metrics_cache)
+        
+        process = self._proc
+        # oneshot() reads each /proc file once for all of the calls below
+        with process.oneshot():
+            metrics = {
                 'memory_mb': process.memory_info().rss / 1024 / 1024,
-                'cpu_percent': process.cpu_percent(),
+                'cpu_percent': process.cpu_percent(interval=None),
                 'thread_count': process.num_threads(),
-                'file_descriptors': process.num_fds() if hasattr(process, 'num_fds') else 0,
-                'timestamp': time.time()
-            }
-        else:
-            # Fallback metrics when psutil is not available
-            return {
-                'memory_mb': 0.0,
-                'cpu_percent': 0.0,
-                'thread_count': threading.active_count(),
-                'file_descriptors': 0,
+                'file_descriptors': self._num_fds() if self._num_fds else 0,
                 'timestamp': time.time()
             }
+        
+        self._metrics_cache = metrics
+        self._metrics_cache_ts = now
+        return dict(metrics)
     
     def _validate_test_results(self, metrics: Dict[str, Any]) -> bool:
         """Validate test results against criteria"""
+        if not metrics:
+            return True  # No resource metrics without psutil
+            
         if metrics['memory_mb'] > self.max_memory_mb:
-            self.logger.warning(f"Memory usage too high: {metrics['memory_mb']:.1f}MB")
+            self.logger.warning("Memory usage too high: %.1fMB", metrics['memory_mb'])
             return False
             
         if metrics['cpu_percent'] > self.max_cpu_percent:
-            self.logger.warning(f"CPU usage too high: {metrics['cpu_percent']:.1f}%")
+            self.logger.warning("CPU usage too high: %.1f%%", metrics['cpu_percent'])
             return False
             
         return True
     
+    def _ticks(self, duration: float, interval: float):
+        """Yield elapsed seconds every interval until duration has passed
+        
+        Sleeps to absolute time.monotonic() deadlines so the cadence does not
+        drift with loop body time or wall-clock adjustments. If an iteration
+        overruns its slot the schedule restarts from now instead of bursting.
+        Stops early once a shutdown has been requested.
+        """
+        start = time.monotonic()
+        deadline = start + duration
+        next_tick = start
+        while not self._stop_event.is_set() and (now := time.monotonic()) < deadline:
+            yield now - start
+            next_tick += interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                self._stop_event.wait(sleep_for)
+            else:
+                next_tick = time.monotonic()
+    
     def test_blinking_effects_stress(self, duration: int):
         """Test rapid LED blinking effects for extended periods"""
         self.logger.info("Running blinking effects stress test")
         
+        # Fixed seed keeps runs reproducible
+        rng = random.Random(0xC0FFEE)
+        
         # Create multiple blinking effects
         effects = []
         for i in range(10):
             effect = create_blink_effect(
                 effect_id=f"stress_blink_{i}",
-                color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)),
+                color=(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)),
                 duty_cycle=0.5,
-                blink_rate=random.uniform(1.0, 5.0),
+                blink_rate=rng.uniform(1.0, 5.0),
                 pixel_indices=list(range(i * 30, (i + 1) * 30))
             )
             effects.append(effect)
             self.animation_controller.add_effect(effect)
             self.animation_controller.start_effect(effect.effect_id)
         
-        # Run for specified duration
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        # Pre-draw random toggles (10% chance per 10ms frame, ~10/s) so the
+        # RNG stays out of the measured loop
+        toggle_count = int(duration * 10)
+        toggle_schedule = sorted(rng.random() * duration for _ in range(toggle_count))
+        toggle_targets = rng.choices(effects, k=toggle_count)
+        next_toggle = 0
+        
+        # Run for specified duration at 100 FPS
+        for elapsed in self._ticks(duration, 0.01):
             self.animation_controller.update()
-            time.sleep(0.01)  # 100 FPS update rate
             
-            # Randomly toggle effects
-            if random.random() < 0.1:  # 10% chance each iteration
-                effect = random.choice(effects)
+            # Apply any toggles that have come due
+            while next_toggle < toggle_count and toggle_schedule[next_toggle] <= elapsed:
+                effect = toggle_targets[next_toggle]
                 if effect.state.value == "running":
                     self.animation_controller.stop_effect(effect.effect_id)
                 else:
                     self.animation_controller.start_effect(effect.effect_id)
+                next_toggle += 1
         
         # Cleanup
         for effect in effects:
@@ -212,11 +313,9 @@ class StressTestSuite:
             self.animation_controller.add_effect(effect)
             self.animation_controller.start_effect(effect.effect_id)
         
-        # Run for specified duration
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        # Run for specified duration at 100 FPS
+        for _ in self._ticks(duration, 0.01):
             self.animation_controller.update()
-            time.sleep(0.01)
         
         # Cleanup
         for effect in effects:
@@ -227,16 +326,13 @@ class StressTestSuite:
         self.logger.info("Running rapid config changes test")
         
         config_files = ['config.py', 'airports', 'hmdata']
+        existing_files = [f for f in config_files if os.path.exists(f)]
         
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        for _ in self._ticks(duration, 0.1):  # 10 changes per second
             # Simulate config file changes
-            for config_file in config_files:
-                if os.path.exists(config_file):
-                    # Touch the file to change modification time
-                    os.utime(config_file, (time.time(), time.time()))
-            
-            time.sleep(0.1)  # 10 changes per second
+            for config_file in existing_files:
+                # Touch the file to change modification time (None = now)
+                os.utime(config_file, None)
     
     def test_memory_leak_detection(self, duration: int):
         """Test for memory leaks during extended operation"""
@@ -246,70 +342,142 @@ class StressTestSuite:
             self.logger.warning("psutil not available, skipping memory leak detection test")
             return
         
-        initial_memory = psutil.Process().memory_info().rss / 1024 / 1024
-        memory_samples = []
+        initial_memory = self._proc.memory_info().rss / 1024 / 1024
+        initial_uss = self._sample_uss_mb()
+        last_uss_time = time.monotonic()
+        # Bounded window of (elapsed_seconds, memory_mb) for trend analysis
+        memory_samples = deque(maxlen=64)
+        
+        # Register one effect per pixel slot up front and cycle them with
+        # start/stop, so allocator churn from building new effects does not
+        # mask a genuine leak
+        effects = [
+            create_blink_effect(
+                effect_id=f"leak_test_{i}",
+                color=(255, 0, 0),
+                pixel_indices=[i]
+            )
+            for i in range(50)
+        ]
+        for effect in effects:
+            self.animation_controller.add_effect(effect)
         
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            # Create and destroy effects repeatedly
-            for i in range(50):
-                effect = create_blink_effect(
-                    effect_id=f"leak_test_{i}",
-                    color=(255, 0, 0),
-                    pixel_indices=[i]
-                )
-                self.animation_controller.add_effect(effect)
-                self.animation_controller.start_effect(effect.effect_id)
-                time.sleep(0.001)
+        try:
+            start_time = time.monotonic()
+            deadline = start_time + duration
+            while not self._stop_event.is_set() and time.monotonic() < deadline:
+                # Start and stop effects repeatedly
+                for effect in effects:
+                    self.animation_controller.start_effect(effect.effect_id)
+                    time.sleep(0.001)
+                    self.animation_controller.stop_effect(effect.effect_id)
+                
+                # Sample memory usage
+                current_memory = self._proc.memory_info().rss / 1024 / 1024
+                memory_samples.append((time.monotonic() - start_time, current_memory))
+                
+                # USS excludes shared pages, so it is a drift-free leak signal,
+                # but reading it is expensive - sample it only occasionally
+                if initial_uss is not None and time.monotonic() - last_uss_time >= self._slow_mem_interval:
+                    last_uss_time = time.monotonic()
+                    uss = self._sample_uss_mb()
+                    if uss is not None:
+                        self.logger.info("USS: %.1fMB (%+.1fMB since start)", uss, uss - initial_uss)
+                
+                self._stop_event.wait(1)
+        finally:
+            for effect in effects:
                 self.animation_controller.remove_effect(effect.effect_id)
-            
-            # Sample memory usage
-            current_memory = psutil.Process().memory_info().rss / 1024 / 1024
-            memory_samples.append(current_memory)
-            
-            time.sleep(1)
+        
+        if not memory_samples:
+            return  # Stopped before the first sample
         
         # Check for memory growth
-        final_memory = memory_samples[-1]
+        final_memory = memory_samples[-1][1]
         memory_growth = final_memory - initial_memory
+        growth_rate = self._memory_growth_rate(memory_samples)
+        self.logger.info(f"Memory trend over last {len(memory_samples)} samples: {growth_rate * 60:.2f}MB/min")
         
         if memory_growth > 50:  # More than 50MB growth
             raise Exception(f"Memory leak detected: {memory_growth:.1f}MB growth")
     
+    def _sample_uss_mb(self) -> Optional[float]:
+        """Unique set size in MB via memory_full_info(), or None if unavailable"""
+        try:
+            return self._proc.memory_full_info().uss / 1024 / 1024
+        except (psutil.Error, AttributeError):
+            return None
+    
+    @staticmethod
+    def _memory_growth_rate(samples) -> float:
+        """Least-squares slope in MB/s of (elapsed_seconds, memory_mb) samples"""
+        n = len(samples)
+        if n < 2:
+            return 0.0
+        mean_t = sum(t for t, _ in samples) / n
+        mean_m = sum(m for _, m in samples) / n
+        var_t = sum((t - mean_t) ** 2 for t, _ in samples)
+        if var_t == 0:
+            return 0.0
+        return sum((t - mean_t) * (m - mean_m) for t, m in samples) / var_t
+    
     def test_concurrent_led_access(self, duration: int):
         """Test concurrent LED access from multiple threads"""
         self.logger.info("Running concurrent LED access test")
         
         def led_worker(worker_id: int):
             """Worker thread for LED operations"""
-            for i in range(1000):
+            # Pre-generate the random LED operations in bulk so the loop
+            # below only indexes into them. Each worker has its own seeded
+            # generator so workers never share RNG state.
+            rng = random.Random(worker_id)
+            iterations = 1000
+            pixels = rng.choices(range(300), k=iterations)
+            channels = rng.choices(range(256), k=iterations * 3)
+            colors = list(zip(channels[0::3], channels[1::3], channels[2::3]))
+            set_ops = rng.choices((True, False), k=iterations)
+            
+            # Buffer pixel writes and flush them in batches so the strip lock
+            # is taken once per batch rather than once per pixel
+            batch_indices = []
+            batch_colors = []
+            
+            def flush():
+                if batch_indices:
+                    self.led_strip.set_pixel_colors(batch_indices, batch_colors)
+                    batch_indices.clear()
+                    batch_colors.clear()
+            
+            for i in range(iterations):
+                if self._stop_event.is_set():
+                    break
                 try:
-                    # Random LED operations
-                    pixel = random.randint(0, 299)
-                    color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-                    
-                    if random.random() < 0.5:
-                        self.led_strip.set_pixel_color(pixel, color)
+                    if set_ops[i]:
+                        batch_indices.append(pixels[i])
+                        batch_colors.append(colors[i])
+                        if len(batch_indices) >= 32:
+                            flush()
                     else:
+                        # Pending writes must land before the frame is shown
+                        flush()
                         self.led_strip.show_pixels()
                     
                     time.sleep(0.001)
                 except Exception as e:
-                    self.logger.error(f"LED worker {worker_id} error: {e}")
-        
-        # Start multiple worker threads
-        threads = []
-        for i in range(10):
-            thread = threading.Thread(target=led_worker, args=(i,))
-            threads.append(thread)
-            thread.start()
+                    self.logger.error("LED worker %d error: %s", worker_id, e)
+            
+            try:
+                flush()
+            except Exception as e:
+                self.logger.error("LED worker %d error: %s", worker_id, e)
         
-        # Wait for duration
-        time.sleep(duration)
+        # Run workers on the shared pool and wait up to duration
+        futures = [self._worker_pool.submit(led_worker, i) for i in range(10)]
+        _, not_done = wait(futures, timeout=duration)
         
-        # Stop threads
-        for thread in threads:
-            thread.join(timeout=1)
+        # Drop any workers that never started
+        for future in not_done:
+            future.cancel()
     
     def test_network_failure_simulation(self, duration: int):
         """Test system behavior during network failures"""
@@ -317,8 +485,8 @@ class StressTestSuite:
         
         # This would simulate network failures by blocking network access
         # For now, we'll just test the reliability manager's circuit breaker
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        deadline = time.monotonic() + duration
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
             try:
                 # Simulate network operations that might fail
                 self.reliability_manager.safe_call(
@@ -326,16 +494,17 @@ class StressTestSuite:
                     lambda: time.sleep(0.1)  # Simulate network call
                 )
             except Exception as e:
-                self.logger.debug(f"Expected network failure: {e}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Expected network failure: %s", e)
             
-            time.sleep(0.1)
+            self._stop_event.wait(0.1)
     
     def test_hardware_conflict_detection(self, duration: int):
         """Test hardware conflict detection and recovery"""
         self.logger.info("Running hardware conflict detection test")
         
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        deadline = time.monotonic() + duration
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
             # Test LED responsiveness
             if not self.led_strip.test_connection():
                 self.logger.warning("LED responsiveness test failed")
@@ -345,35 +514,33 @@ class StressTestSuite:
             if not status['initialized']:
                 raise Exception("LED strip lost initialization")
             
-            time.sleep(1)
+            self._stop_event.wait(1)
     
     def test_soak_test(self, duration: int = 3600):
         """Long-term soak test for 1 hour"""
         self.logger.info(f"Running soak test for {duration} seconds")
         
-        start_time = time.time()
+        # Mix of all tests, indexed by iteration % 10; remaining slots
+        # simulate normal operation
+        dispatch = (
+            lambda: self.test_blinking_effects_stress(10),
+            lambda: self.test_weather_effects_stress(10),
+            lambda: self.test_concurrent_led_access(10),
+        ) + (self.animation_controller.update,) * 7
+        
+        deadline = time.monotonic() + duration
         iteration = 0
         
-        while time.time() - start_time < duration:
+        while not self._stop_event.is_set() and time.monotonic() < deadline:
             iteration += 1
-            
-            # Run a mix of all tests
-            if iteration % 10 == 0:
-                self.test_blinking_effects_stress(10)
-            elif iteration % 10 == 1:
-                self.test_weather_effects_stress(10)
-            elif iteration % 10 == 2:
-                self.test_concurrent_led_access(10)
-            else:
-                # Normal operation simulation
-                self.animation_controller.update()
+            dispatch[iteration % 10]()
             
             # Health check
             health_status = self.reliability_manager.check_health(self.led_strip)
             if health_status == HealthStatus.CRITICAL:
                 raise Exception("Critical health status detected during soak test")
             
-            time.sleep(1)
+            self._stop_event.wait(1)
     
     def run_all_tests(self, test_duration: int = 60):
         """Run all stress tests"""
@@ -396,7 +563,7 @@ class StressTestSuite:
             ]
             
             for test_func, test_name, duration in tests:
-                if not self.running:
+                if not self.running or self._stop_event.is_set():
                     break
                     
                 result = self.run_test(test_func, test_name, duration)
@@ -405,7 +572,7 @@ class StressTestSuite:
                     break
             
             # Run soak test if all individual tests passed
-            if all(r.passed for r in self.results):
+            if self._failed == 0 and not self._stop_event.is_set():
                 self.logger.info("All individual tests passed, starting soak test")
                 self.run_test(self.test_soak_test, "Soak Test", 3600)  # 1 hour
             
@@ -421,7 +588,7 @@ class StressTestSuite:
     def _generate_report(self):
         """Generate test report"""
         total_duration = time.time() - self.start_time if self.start_time else 0
-        passed_tests = sum(1 for r in self.results if r.passed)
+        passed_tests = self._passed
         total_tests = len(self.results)
         
         report = {
@@ -432,22 +599,17 @@ class StressTestSuite:
                 'success_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0,
                 'total_duration': total_duration
             },
-            'results': [
-                {
-                    'test_name': r.test_name,
-                    'passed': r.passed,
-                    'duration': r.duration,
-                    'error_message': r.error_message,
-                    'metrics': r.metrics
-                }
-                for r in self.results
-            ]
+            'results': self.results
         }
         
-        # Save report
+        # Save report (TestResult dataclasses are serialized field by field)
         report_file = f"stress_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2, default=asdict)
         
         # Print summary
         self.logger.info("=" * 50)
@@ -479,16 +641,22 @@ def main():
     
     args = parser.parse_args()
     
-    # Setup signal handler for graceful shutdown
+    suite = StressTestSuite()
+    
+    # Setup signal handler for graceful shutdown - test loops poll the
+    # stop event and wind down, then cleanup and reporting run as normal.
+    # A second signal exits immediately in case a test is hung.
     def signal_handler(signum, frame):
+        if suite.is_stop_requested():
+            print("\nReceived second interrupt signal, exiting now")
+            sys.exit(1)
         print("\nReceived interrupt signal, shutting down gracefully...")
-        sys.exit(0)
+        suite.request_stop()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     # Run tests
-    suite = StressTestSuite()
     
     if args.soak:
         suite.setup()
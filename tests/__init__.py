@@ -0,0 +1 @@
+"""LiveSectional test suite (package marker for unittest discovery from the repository root)."""
@@ -0,0 +1,11 @@
+"""
+pytest configuration for the LiveSectional test suite
+
+Puts the repository root on sys.path once per session so the test modules
+can import faa_api_client, flight_category and friends directly.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -6,26 +6,142 @@ including error handling, retry logic, and XML parsing.
 """
 
 import unittest
+import io
 import xml.etree.ElementTree as ET
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import mock_open
 import urllib.error
+import urllib.request
 import json
-import os
-import sys
+import re
+from types import MappingProxyType
 
-# Add parent directory to path to import faa_api_client
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from faa_api_client import FAAAPIClient, NetworkError, APIError, AviationWeatherAPIError, CircuitBreaker
 
-from faa_api_client import FAAAPIClient, NetworkError, APIError, AviationWeatherAPIError
+
+# Read-only query parameters shared by the _make_request tests
+_PARAMS = MappingProxyType({'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
+_PARAMS_MULTI = MappingProxyType({'format': 'xml', 'ids': 'KORD,KLAX,KJFK', 'hours': '2.5'})
+
+# XML documents shared by the parsing tests
+_METAR_XML = '<response><METAR><station_id>KORD</station_id><flight_category>VFR</flight_category></METAR></response>'
+_EMPTY_XML = '<response></response>'
+
+# Raw response bodies as urlopen returns them, and the decoded text _make_request yields
+_METAR_BYTES = b'<response><METAR><station_id>KORD</station_id></METAR></response>'
+_METAR_STR = _METAR_BYTES.decode('ascii')
+_EMPTY_BYTES = _EMPTY_XML.encode('ascii')
+
+# Single-record responses for each getter, keyed by record tag
+_GETTER_PAYLOADS = {
+    tag: '<response><{0}><station_id>KORD</station_id></{0}></response>'.format(tag)
+    for tag in ('METAR', 'TAF', 'Station')
+}
+# The same payloads parsed once, for tests that don't exercise _parse_xml
+_GETTER_TREES = {tag: ET.fromstring(xml) for tag, xml in _GETTER_PAYLOADS.items()}
+
+# More airports than fit in one request chunk
+_LARGE_AIRPORTS = [f"K{i:03d}" for i in range(500)]
+
+
+class _FakeResp:
+    """Minimal stand-in for the response object yielded by urlopen()"""
+    __slots__ = ("code", "body", "stream")
+    
+    def __init__(self, code, body):
+        self.code = code
+        self.body = body
+        self.stream = None  # BytesIO over body while the response is open
+        
+    def getcode(self):
+        return self.code
+        
+    def read(self):
+        return self.stream.read()
+
+
+class _FakeCM:
+    """Context manager matching urlopen(): opens the body stream on enter, closes it on exit"""
+    __slots__ = ("resp",)
+    
+    def __init__(self, resp):
+        self.resp = resp
+        
+    def __enter__(self):
+        self.resp.stream = io.BytesIO(self.resp.body)
+        return self.resp
+        
+    def __exit__(self, *exc_info):
+        self.resp.stream.close()
+        return False
 
 
 class TestFAAAPIClient(unittest.TestCase):
     """Test cases for FAAAPIClient class"""
     
+    _RE_PARSE_FAILED = re.compile(r"Failed to parse XML")
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up one client shared by all test methods"""
+        cls.client = FAAAPIClient()
+        cls.sample_airports = ["KORD", "KLAX", "KJFK"]
+        
     def setUp(self):
-        """Set up test fixtures before each test method"""
-        self.client = FAAAPIClient()
-        self.sample_airports = ["KORD", "KLAX", "KJFK"]
+        """Reset per-test state before each test method"""
+        # Failures recorded by error-path tests must not open the breaker for later tests
+        self.client.circuit_breaker = CircuitBreaker()
+        self._orig_urlopen = urllib.request.urlopen
+        
+        # Never wait through real retry backoff; record the requested delays instead
+        self._sleeps = []
+        self.addCleanup(setattr, self.client, '_sleep', self.client._sleep)
+        self.client._sleep = self._sleeps.append
+        
+    def tearDown(self):
+        """Restore the real urlopen after each test"""
+        urllib.request.urlopen = self._orig_urlopen
+        
+    def _fake_urlopen(self, *outcomes):
+        """
+        Replace urlopen with a plain function returning or raising each outcome
+        in turn (the last outcome repeats). Returns the list of requests made.
+        """
+        requests = []
+        
+        def urlopen(request, timeout=None):
+            requests.append(request)
+            outcome = outcomes[min(len(requests), len(outcomes)) - 1]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return _FakeCM(outcome)
+            
+        urllib.request.urlopen = urlopen
+        return requests
+        
+    def _stub_make_request(self, ret=None, exc=None, parsed=None):
+        """
+        Shadow the shared client's _make_request with a plain function that
+        returns ret or raises exc. When parsed is given, _parse_xml is also
+        shadowed to return that pre-parsed root. Returns the list of
+        (endpoint, params) calls.
+        """
+        calls = []
+        
+        def make_request(endpoint, params):
+            calls.append((endpoint, params))
+            if exc is not None:
+                raise exc
+            return ret
+            
+        if '_make_request' not in vars(self.client):
+            self.addCleanup(delattr, self.client, '_make_request')
+        self.client._make_request = make_request
+        
+        if parsed is not None:
+            if '_parse_xml' not in vars(self.client):
+                self.addCleanup(delattr, self.client, '_parse_xml')
+            self.client._parse_xml = lambda xml_content: parsed
+        return calls
         
     def test_init_default_values(self):
         """Test client initialization with default values"""
@@ -50,146 +166,115 @@ class TestFAAAPIClient(unittest.TestCase):
         
     def test_make_request_url_building(self):
         """Test URL building for METAR requests"""
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_response = MagicMock()
-            mock_response.getcode.return_value = 200
-            mock_response.read.return_value = b'<response></response>'
-            mock_urlopen.return_value.__enter__.return_value = mock_response
-            
-            self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD,KLAX,KJFK', 'hours': '2.5'})
-            
-            # Verify the URL was constructed correctly
-            call_args = mock_urlopen.call_args[0][0]
-            self.assertIn('https://aviationweather.gov/api/data/metar', call_args.full_url)
-            self.assertIn('format=xml', call_args.full_url)
-            self.assertIn('ids=KORD,KLAX,KJFK', call_args.full_url)
-            self.assertIn('hours=2.5', call_args.full_url)
-        
-    @patch('urllib.request.urlopen')
-    def test_make_request_success(self, mock_urlopen):
+        requests = self._fake_urlopen(_FakeResp(200, _EMPTY_BYTES))
+        
+        self.client._make_request('/metar', _PARAMS_MULTI)
+        
+        # Verify the URL was constructed correctly
+        full_url = requests[0].full_url
+        self.assertIn('https://aviationweather.gov/api/data/metar', full_url)
+        self.assertIn('format=xml', full_url)
+        self.assertIn('ids=KORD,KLAX,KJFK', full_url)
+        self.assertIn('hours=2.5', full_url)
+        
+    def test_make_request_success(self):
         """Test successful API request"""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.getcode.return_value = 200
-        mock_response.read.return_value = b'<response><METAR><station_id>KORD</station_id></METAR></response>'
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        # Fake successful response
+        requests = self._fake_urlopen(
+            _FakeResp(200, _METAR_BYTES)
+        )
         
-        status_code, response_body = self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
+        status_code, response_body = self.client._make_request('/metar', _PARAMS)
         
         self.assertEqual(status_code, 200)
-        self.assertEqual(response_body, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-        mock_urlopen.assert_called_once()
+        self.assertEqual(response_body, _METAR_STR)
+        self.assertEqual(len(requests), 1)
         
-    @patch('urllib.request.urlopen')
-    def test_make_request_204_no_content(self, mock_urlopen):
-        """Test 204 No Content response handling"""
-        # Mock 204 response
-        mock_response = MagicMock()
-        mock_response.getcode.return_value = 204
-        mock_response.read.return_value = b''
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-        
-        status_code, response_body = self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
+    def test_make_request_reads_and_closes_body(self):
+        """Test the response body is read and the response closed when the request completes"""
+        response = _FakeResp(200, _METAR_BYTES)
+        self._fake_urlopen(response)
         
-        self.assertEqual(status_code, 204)
-        self.assertEqual(response_body, '')
-        mock_urlopen.assert_called_once()
-        
-    @patch('urllib.request.urlopen')
-    def test_make_request_404_error(self, mock_urlopen):
-        """Test 404 error handling"""
-        # Mock 404 response
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://test.example.com", 404, "Not Found", {}, None
-        )
+        _, response_body = self.client._make_request('/metar', _PARAMS)
         
-        with self.assertRaises(APIError) as context:
-            self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-            
-        self.assertIn("404", str(context.exception))
-        
-    @patch('urllib.request.urlopen')
-    def test_make_request_500_error(self, mock_urlopen):
-        """Test 500 error handling"""
-        # Mock 500 response
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "https://test.example.com", 500, "Internal Server Error", {}, None
-        )
+        self.assertEqual(response_body, _METAR_STR)
+        self.assertTrue(response.stream.closed)
         
-        with self.assertRaises(APIError) as context:
-            self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-            
-        self.assertIn("500", str(context.exception))
+    def test_make_request_204_no_content(self):
+        """Test 204 No Content response handling"""
+        # Fake 204 response
+        requests = self._fake_urlopen(_FakeResp(204, b''))
         
-    @patch('urllib.request.urlopen')
-    def test_make_request_network_error(self, mock_urlopen):
-        """Test network error handling"""
-        # Mock network error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+        status_code, response_body = self.client._make_request('/metar', _PARAMS)
         
-        with self.assertRaises(NetworkError) as context:
-            self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-            
-        self.assertIn("Connection refused", str(context.exception))
+        self.assertEqual(status_code, 204)
+        self.assertEqual(response_body, '')
+        self.assertEqual(len(requests), 1)
         
-    @patch('urllib.request.urlopen')
-    def test_make_request_timeout_error(self, mock_urlopen):
-        """Test timeout error handling"""
-        # Mock timeout error
-        mock_urlopen.side_effect = urllib.error.URLError("timed out")
+    def test_make_request_error_matrix(self):
+        """Test HTTP, network and timeout error handling"""
+        http_cases = [
+            (urllib.error.HTTPError("https://test.example.com", 404, "Not Found", {}, None), 404),
+            (urllib.error.HTTPError("https://test.example.com", 500, "Internal Server Error", {}, None), 500),
+        ]
+        network_cases = [re.compile(r"Connection refused"), re.compile(r"timed out")]
         
-        with self.assertRaises(NetworkError) as context:
-            self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-            
-        self.assertIn("timed out", str(context.exception))
+        for error, expected_status in http_cases:
+            with self.subTest(status=expected_status):
+                self.client.circuit_breaker = CircuitBreaker()
+                self._fake_urlopen(error)
+                
+                with self.assertRaises(APIError) as context:
+                    self.client._make_request('/metar', _PARAMS)
+                    
+                self.assertEqual(context.exception.status_code, expected_status)
+                
+        for reason in network_cases:
+            with self.subTest(reason=reason.pattern):
+                self.client.circuit_breaker = CircuitBreaker()
+                self._fake_urlopen(urllib.error.URLError(reason.pattern))
+                
+                with self.assertRaisesRegex(NetworkError, reason):
+                    self.client._make_request('/metar', _PARAMS)
         
-    @patch('urllib.request.urlopen')
-    def test_make_request_retry_logic(self, mock_urlopen):
+    def test_make_request_retry_logic(self):
         """Test retry logic on network errors"""
-        # Mock network error on first two calls, success on third
-        mock_response = MagicMock()
-        mock_response.getcode.return_value = 200
-        mock_response.read.return_value = b'<response></response>'
-        
-        mock_urlopen.side_effect = [
+        # Fake network error on first two calls, success on third
+        requests = self._fake_urlopen(
             urllib.error.URLError("Connection refused"),
             urllib.error.URLError("Connection refused"),
-            mock_response
-        ]
+            _FakeResp(200, _EMPTY_BYTES)
+        )
+        
+        status_code, response_body = self.client._make_request('/metar', _PARAMS)
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            status_code, response_body = self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-            
         self.assertEqual(status_code, 200)
-        self.assertEqual(response_body, '<response></response>')
-        self.assertEqual(mock_urlopen.call_count, 3)
+        self.assertEqual(response_body, _EMPTY_XML)
+        self.assertEqual(len(requests), 3)
+        # Exponential backoff before each of the two retries
+        self.assertEqual(self._sleeps, [1.0, 2.0])
         
-    @patch('urllib.request.urlopen')
-    def test_make_request_max_retries_exceeded(self, mock_urlopen):
+    def test_make_request_max_retries_exceeded(self):
         """Test max retries exceeded"""
-        # Mock persistent network error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+        # Fake persistent network error
+        requests = self._fake_urlopen(urllib.error.URLError("Connection refused"))
         
-        with patch('time.sleep'):  # Mock sleep to speed up test
-            with self.assertRaises(NetworkError):
-                self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-                
-        self.assertEqual(mock_urlopen.call_count, 4)  # Initial + 3 retries
+        with self.assertRaises(NetworkError):
+            self.client._make_request('/metar', _PARAMS)
+            
+        self.assertEqual(len(requests), 4)  # Initial + 3 retries
         
     def test_parse_xml_valid(self):
         """Test XML parsing with valid response"""
-        xml_data = '<response><METAR><station_id>KORD</station_id><flight_category>VFR</flight_category></METAR></response>'
-        result = self.client._parse_xml(xml_data)
+        result = self.client._parse_xml(_METAR_XML)
         
         self.assertEqual(result.tag, 'response')
-        metar = result.find('METAR')
-        self.assertEqual(metar.find('station_id').text, 'KORD')
-        self.assertEqual(metar.find('flight_category').text, 'VFR')
+        self.assertEqual(result.find('METAR/station_id').text, 'KORD')
+        self.assertEqual(result.find('METAR/flight_category').text, 'VFR')
         
     def test_parse_xml_empty(self):
         """Test XML parsing with empty response"""
-        xml_data = '<response></response>'
-        result = self.client._parse_xml(xml_data)
+        result = self.client._parse_xml(_EMPTY_XML)
         
         self.assertEqual(result.tag, 'response')
         
@@ -197,62 +282,38 @@ class TestFAAAPIClient(unittest.TestCase):
         """Test XML parsing with invalid XML"""
         xml_data = '<invalid xml>'
         
-        with self.assertRaises(APIError) as context:
+        with self.assertRaisesRegex(APIError, self._RE_PARSE_FAILED):
             self.client._parse_xml(xml_data)
-            
-        self.assertIn("Failed to parse XML", str(context.exception))
-        
-    @patch.object(FAAAPIClient, '_make_request')
-    def test_get_metars_success(self, mock_request):
-        """Test successful METAR retrieval"""
-        # Mock response
-        mock_request.return_value = (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-        
-        result = self.client.get_metars(self.sample_airports, 2.5, "xml")
-        
-        self.assertEqual(len(result), 1)
-        mock_request.assert_called_once()
-        
-    @patch.object(FAAAPIClient, '_make_request')
-    def test_get_metars_network_error(self, mock_request):
-        """Test METAR retrieval with network error"""
-        mock_request.side_effect = NetworkError("Connection failed")
-        
-        with self.assertRaises(NetworkError):
-            self.client.get_metars(self.sample_airports, 2.5, "xml")
-            
-    @patch.object(FAAAPIClient, '_make_request')
-    def test_get_metars_api_error(self, mock_request):
-        """Test METAR retrieval with API error"""
-        mock_request.side_effect = APIError("404 Not Found")
         
-        with self.assertRaises(APIError):
-            self.client.get_metars(self.sample_airports, 2.5, "xml")
+    def test_get_metars_errors(self):
+        """Test METAR retrieval propagates network and API errors"""
+        for error in (NetworkError("Connection failed"), APIError("404 Not Found")):
+            with self.subTest(error=type(error).__name__):
+                self._stub_make_request(exc=error)
+                
+                with self.assertRaises(type(error)):
+                    self.client.get_metars(self.sample_airports, 2.5, "xml")
             
-    @patch.object(FAAAPIClient, '_make_request')
-    def test_get_tafs_success(self, mock_request):
-        """Test successful TAF retrieval"""
-        mock_request.return_value = (200, '<response><TAF><station_id>KORD</station_id></TAF></response>')
-        
-        result = self.client.get_tafs(self.sample_airports, 6, "xml")
-        
-        self.assertEqual(len(result), 1)
-        mock_request.assert_called_once()
-        
-    @patch.object(FAAAPIClient, '_make_request')
-    def test_get_station_info_success(self, mock_request):
-        """Test successful station info retrieval"""
-        mock_request.return_value = (200, '<response><Station><station_id>KORD</station_id></Station></response>')
-        
-        result = self.client.get_station_info(self.sample_airports, "xml")
+    def test_getters_success(self):
+        """Test successful METAR, TAF and station info retrieval"""
+        cases = [
+            ("get_metars", (2.5, "xml"), "METAR"),
+            ("get_tafs", (6, "xml"), "TAF"),
+            ("get_station_info", ("xml",), "Station"),
+        ]
         
-        self.assertEqual(len(result), 1)
-        mock_request.assert_called_once()
+        for method_name, extra_args, tag in cases:
+            with self.subTest(method=method_name):
+                calls = self._stub_make_request(ret=(200, _GETTER_PAYLOADS[tag]), parsed=_GETTER_TREES[tag])
+                
+                result = getattr(self.client, method_name)(self.sample_airports, *extra_args)
+                
+                self.assertEqual(len(result), 1)
+                self.assertEqual(len(calls), 1)
         
     def test_chunk_airports(self):
         """Test airport chunking functionality"""
-        large_airport_list = [f"K{i:03d}" for i in range(500)]
-        chunks = self.client._chunk_airports(large_airport_list, chunk_size=300)
+        chunks = self.client._chunk_airports(_LARGE_AIRPORTS, chunk_size=300)
         
         self.assertEqual(len(chunks), 2)
         self.assertEqual(len(chunks[0]), 300)
@@ -280,6 +341,8 @@ class TestExceptionHierarchy(unittest.TestCase):
         
         self.assertEqual(str(network_error), "Connection failed")
         self.assertEqual(str(api_error), "404 Not Found")
+        self.assertIsNone(api_error.status_code)
+        self.assertEqual(APIError("Not Found", 404).status_code, 404)
         self.assertEqual(str(base_error), "Generic error")
 
 
@@ -6,115 +6,111 @@ and the main application components.
 """
 
 import unittest
-import os
-import sys
+import urllib.error
 import tempfile
 import shutil
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from faa_api_client import FAAAPIClient, NetworkError, APIError
 
+# Single-METAR body returned by the mocked _make_request (decoded str, as the client returns)
+_MOCK_OK_XML = '<response><METAR><station_id>KORD</station_id></METAR></response>'
+_MOCK_OK_RESPONSE = (200, _MOCK_OK_XML)
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the aviation weather API migration"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one client shared by all test methods"""
+        # Tests go through the mocked _make_request, so the client is never mutated
+        cls.client = FAAAPIClient()
+        cls.sample_airports = ["KORD", "KLAX", "KJFK"]
+        
+        # Install the _make_request mock once; tests only reconfigure it
+        cls._request_patcher = patch.object(cls.client, '_make_request')
+        cls.mock_request = cls._request_patcher.start()
+        cls.addClassCleanup(cls._request_patcher.stop)
+        
     def setUp(self):
-        """Set up test fixtures"""
-        self.client = FAAAPIClient()
-        self.sample_airports = ["KORD", "KLAX", "KJFK"]
+        """Clear calls, return values and side effects left by the previous test"""
+        self.mock_request.reset_mock(return_value=True, side_effect=True)
         
-    def test_metar_v4_integration(self):
-        """Test integration with metar-v4.py functionality"""
-        # This would test the actual metar-v4.py script if it were importable
-        # For now, we test the API client methods that metar-v4.py would use
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock successful response
-            mock_request.return_value = (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            
-            result = self.client.get_metars(self.sample_airports, 2.5, "xml")
-            
-            self.assertEqual(len(result), 1)
-            mock_request.assert_called_once()
-                
-    def test_metar_display_v4_integration(self):
-        """Test integration with metar-display-v4.py functionality"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock successful response
-            mock_request.return_value = (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            
-            result = self.client.get_metars(self.sample_airports, 2.5, "xml")
-            
-            self.assertEqual(len(result), 1)
-                
-    def test_wipes_v4_integration(self):
-        """Test integration with wipes-v4.py functionality"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock successful response
-            mock_request.return_value = (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            
-            result = self.client.get_metars(self.sample_airports, 2.5, "xml")
-            
-            self.assertEqual(len(result), 1)
+    def test_v4_scripts_get_metars_integration(self):
+        """Test integration with metar-v4.py, metar-display-v4.py and wipes-v4.py"""
+        # The scripts aren't importable and all make the same get_metars call,
+        # so test that API client call once
+        self.mock_request.return_value = _MOCK_OK_RESPONSE
+        
+        result = self.client.get_metars(self.sample_airports, 2.5, "xml")
+        
+        self.assertEqual(len(result), 1)
+        self.mock_request.assert_called_once()
                 
     def test_app_integration(self):
         """Test integration with app.py functionality"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock successful response for both METAR and station info
-            mock_request.return_value = (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            
-            # Test METAR retrieval
-            metar_result = self.client.get_metars(self.sample_airports, 2.5, "xml")
-            self.assertEqual(len(metar_result), 1)
+        # Mock successful response for both METAR and station info
+        self.mock_request.return_value = _MOCK_OK_RESPONSE
+        
+        # Test METAR retrieval
+        metar_result = self.client.get_metars(self.sample_airports, 2.5, "xml")
+        self.assertEqual(len(metar_result), 1)
+        
+        # Test station info retrieval
+        station_result = self.client.get_station_info(self.sample_airports, "xml")
+        self.assertEqual(len(station_result), 1)
             
-            # Test station info retrieval
-            station_result = self.client.get_station_info(self.sample_airports, "xml")
-            self.assertEqual(len(station_result), 1)
-                
     def test_error_handling_integration(self):
         """Test error handling across all components"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Test network error
-            mock_request.side_effect = NetworkError("Connection failed")
+        # Test network error
+        self.mock_request.side_effect = NetworkError("Connection failed")
+        
+        with self.assertRaises(NetworkError):
+            self.client.get_metars(self.sample_airports, 2.5, "xml")
             
-            with self.assertRaises(NetworkError):
-                self.client.get_metars(self.sample_airports, 2.5, "xml")
-                
-            # Test API error
-            mock_request.side_effect = APIError("404 Not Found")
+        # Test API error
+        self.mock_request.side_effect = APIError("404 Not Found")
+        
+        with self.assertRaises(APIError):
+            self.client.get_metars(self.sample_airports, 2.5, "xml")
             
-            with self.assertRaises(APIError):
-                self.client.get_metars(self.sample_airports, 2.5, "xml")
-                
     def test_retry_logic_integration(self):
         """Test retry logic across all components"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock network error on first two calls, success on third
-            mock_request.side_effect = [
-                NetworkError("Connection failed"),
-                NetworkError("Connection failed"),
-                (200, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            ]
-            
-            with patch('time.sleep'):  # Mock sleep to speed up test
-                status_code, response_body = self.client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
-                
-            self.assertEqual(status_code, 200)
-            self.assertEqual(response_body, '<response><METAR><station_id>KORD</station_id></METAR></response>')
-            self.assertEqual(mock_request.call_count, 3)
-            
+        # The shared client's _make_request is mocked, so use a real one here
+        # and fake the network underneath it instead
+        client = FAAAPIClient()
+        sleeps = []
+        client._sleep = sleeps.append  # Record backoff instead of waiting
+        
+        response = MagicMock()
+        response.getcode.return_value = 200
+        response.read.return_value = _MOCK_OK_XML.encode('utf-8')
+        ok = MagicMock()
+        ok.__enter__.return_value = response
+        
+        # Network error on first two calls, success on third
+        with patch('faa_api_client.urllib.request.urlopen', side_effect=[
+            urllib.error.URLError("Connection failed"),
+            urllib.error.URLError("Connection failed"),
+            ok
+        ]) as mock_urlopen:
+            status_code, response_body = client._make_request('/metar', {'format': 'xml', 'ids': 'KORD', 'hours': '2.5'})
+        
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response_body, _MOCK_OK_XML)
+        self.assertEqual(mock_urlopen.call_count, 3)
+        self.assertEqual(sleeps, [1.0, 2.0])
+        
     def test_204_handling_integration(self):
         """Test 204 No Content handling across all components"""
-        with patch.object(self.client, '_make_request') as mock_request:
-            # Mock 204 response
-            mock_request.return_value = (204, '')
-                
-            result = self.client.get_metars(self.sample_airports, 2.5, "xml")
+        # Mock 204 response
+        self.mock_request.return_value = (204, '')
             
-            self.assertEqual(len(result), 0)
-            mock_request.assert_called_once()
+        result = self.client.get_metars(self.sample_airports, 2.5, "xml")
+        
+        self.assertEqual(len(result), 0)
+        self.mock_request.assert_called_once()
 
 
 if __name__ == '__main__':